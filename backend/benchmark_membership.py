@@ -0,0 +1,87 @@
+"""
+Benchmark membership function evaluation and sparse batched inference
+"""
+import time
+
+import numpy as np
+
+from src.fuzzy import (
+    FuzzyVariable,
+    GaussianMF,
+    GeneralizedBellMF,
+    MamdaniEngine,
+    SigmoidMF,
+    TrapezoidalMF,
+    TriangularMF,
+    create_washing_machine_engine,
+)
+
+
+def best_time(func, repeat: int = 5) -> float:
+    """Best wall-clock time of several runs, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def create_gaussian_engine(epsilon: float) -> MamdaniEngine:
+    """Washing machine engine with the triangular sets replaced by Gaussians."""
+    engine = create_washing_machine_engine()
+    for variable in list(engine.input_variables.values()) + list(engine.output_variables.values()):
+        smooth = FuzzyVariable(variable.name, variable.range_min, variable.range_max)
+        for name, mf in variable.membership_functions.items():
+            smooth.add_mf(GaussianMF(name, mf.b, max(mf.c - mf.a, 1) / 4, epsilon))
+        if variable.name in engine.input_variables:
+            engine.add_input_variable(smooth)
+        else:
+            engine.add_output_variable(smooth)
+    return engine
+
+
+def benchmark_membership():
+    """Scalar vs vectorized evaluation for each membership function type."""
+    x = np.random.default_rng(0).uniform(0, 200, 1_000_000)
+    functions = [
+        TriangularMF("tri", 0, 100, 200),
+        TrapezoidalMF("trap", 0, 50, 150, 200),
+        GaussianMF("gauss", 100, 30),
+        GeneralizedBellMF("bell", 40, 2, 100),
+        SigmoidMF("sigmoid", 0.1, 100),
+    ]
+
+    print(f"\n📏 Membership evaluation ({len(x):,} points)")
+    print(f"   {'type':<20}{'scalar (10k)':>14}{'vectorized':>14}{'Mpts/s':>10}")
+    for mf in functions:
+        scalar = best_time(lambda: [mf.membership(v) for v in x[:10_000]], repeat=3)
+        vectorized = best_time(lambda: mf.membership_array(x))
+        print(
+            f"   {type(mf).__name__:<20}{scalar * 1e3:>11.2f} ms"
+            f"{vectorized * 1e3:>11.2f} ms{len(x) / vectorized / 1e6:>10.1f}"
+        )
+
+
+def benchmark_inference():
+    """Batched inference with linear, truncated and untruncated smooth sets."""
+    rng = np.random.default_rng(1)
+    inputs = {"dirt": rng.uniform(0, 200, 200_000), "grease": rng.uniform(0, 200, 200_000)}
+    engines = {
+        "triangular": create_washing_machine_engine(),
+        "gaussian (eps=1e-3)": create_gaussian_engine(1e-3),
+        "gaussian (eps=0)": create_gaussian_engine(0.0),
+    }
+
+    print(f"\n⚙️  infer_batch ({len(inputs['dirt']):,} rows)")
+    for label, engine in engines.items():
+        elapsed = best_time(lambda: engine.infer_batch(inputs), repeat=3)
+        print(f"   {label:<22}{elapsed * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    print("🧪 Membership Function Benchmark")
+    print("=" * 50)
+    benchmark_membership()
+    benchmark_inference()
+    print("\n" + "=" * 50)
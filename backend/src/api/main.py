@@ -2,14 +2,18 @@
 FastAPI application for fuzzy logic controller.
 Provides REST API for educational fuzzy logic demonstrations.
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Header, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Dict, List
+from typing import Dict, List, Literal, Optional
+from functools import lru_cache
+import gzip
 import numpy as np
 import os
+import struct
 from pathlib import Path
 from dotenv import load_dotenv
+import brotli
 
 from ..fuzzy import create_washing_machine_engine, create_washing_machine_variables
 
@@ -66,7 +70,8 @@ async def root():
             "POST /fuzzy/washing-machine": "Calculate washing time",
             "GET /fuzzy/membership-functions": "Get membership function definitions",
             "GET /fuzzy/rules": "Get fuzzy rule base",
-            "POST /fuzzy/visualize": "Get visualization data"
+            "POST /fuzzy/visualize": "Get visualization data",
+            "GET /fuzzy/surface": "Get precomputed control surface (binary)"
         }
     }
 
@@ -201,6 +206,154 @@ async def get_visualization_data(input_data: VisualizationInput):
     }
 
 
+# Largest surface resolution served; one grid point per integer input from
+# 0 to 200. With rules and float32 a payload is 10 * 201² * 4 B ≈ 1.6 MB, so
+# the encoded-payload cache below holds at most about 26 MB.
+MAX_SURFACE_RESOLUTION = 201
+
+
+def build_control_surface(resolution: int, dtype: str, include_rules: bool) -> bytes:
+    """
+    Build the binary control surface of the fuzzy engine.
+
+    Layout (little-endian):
+        uint32 header length, JSON header, zero padding to an 8-byte
+        boundary, then each array of the header's "arrays" list in order,
+        row-major with shape "shape" (axis i follows "inputs"[i]).
+
+    Args:
+        resolution: Grid points per input variable
+        dtype: "float16" or "float32"
+        include_rules: Append one firing-strength grid per rule
+
+    Returns:
+        Uncompressed payload bytes
+    """
+    variables = list(fuzzy_engine.input_variables.values())
+    axes = [
+        np.linspace(var.range_min, var.range_max, resolution)
+        for var in variables
+    ]
+    mesh = np.meshgrid(*axes, indexing="ij")
+    shape = mesh[0].shape
+
+    result = fuzzy_engine.infer_batch(
+        {var.name: grid.ravel() for var, grid in zip(variables, mesh)},
+        return_rule_activations=include_rules
+    )
+
+    arrays = list(result["output"].items())
+    if include_rules:
+        arrays += [
+            (str(rule), activation)
+            for rule, activation in zip(fuzzy_engine.rules, result["rule_activations"])
+        ]
+
+    header = json.dumps({
+        "dtype": dtype,
+        "shape": list(shape),
+        "inputs": [
+            {"name": var.name, "range": [var.range_min, var.range_max]}
+            for var in variables
+        ],
+        "arrays": [name for name, _ in arrays]
+    }, ensure_ascii=False).encode("utf-8")
+    padding = -(4 + len(header)) % 8
+
+    data = b"".join(
+        np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder("<")).tobytes()
+        for _, values in arrays
+    )
+    return struct.pack("<I", len(header)) + header + b"\0" * padding + data
+
+
+@lru_cache(maxsize=16)
+def encode_control_surface(
+    resolution: int, dtype: str, include_rules: bool, encoding: str
+) -> bytes:
+    """
+    Compress a control surface payload with the given content encoding.
+
+    Only the encoded result is cached; resolution is capped at
+    MAX_SURFACE_RESOLUTION so clients cannot pin large payloads in memory.
+    """
+    payload = build_control_surface(resolution, dtype, include_rules)
+    if encoding == "br":
+        return brotli.compress(payload)
+    if encoding == "gzip":
+        return gzip.compress(payload, mtime=0)
+    return payload
+
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """
+    Parse an Accept-Encoding header into {coding: q-value}.
+
+    Codings with q=0 are refused by the client and are left out.
+    """
+    accepted = {}
+    for token in (accept_encoding or "").split(","):
+        coding, *params = [part.strip() for part in token.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted[coding.lower()] = quality
+    return accepted
+
+
+@app.get("/fuzzy/surface")
+def get_control_surface(
+    resolution: int = Query(default=MAX_SURFACE_RESOLUTION, ge=2, le=MAX_SURFACE_RESOLUTION),
+    dtype: Literal["float16", "float32"] = "float32",
+    include_rules: bool = False,
+    accept_encoding: Optional[str] = Header(default=None)
+):
+    """
+    Get the precomputed output surface over the whole input space.
+
+    Declared without async so FastAPI runs the CPU-bound build in its
+    threadpool instead of blocking the event loop.
+
+    The client fetches it once and interpolates locally instead of calling
+    /fuzzy/visualize on every input change. The default resolution of 201
+    puts a grid point on every integer input from 0 to 200.
+
+    Args:
+        resolution: Grid points per input variable
+        dtype: Element type of the arrays
+        include_rules: Also return per-rule firing strength grids
+
+    Returns:
+        Binary payload (see build_control_surface), compressed with brotli
+        or gzip when the client accepts it
+    """
+    accepted = parse_accept_encoding(accept_encoding)
+    candidates = [coding for coding in ("br", "gzip") if coding in accepted]
+    # Highest q-value wins, brotli before gzip on ties
+    encoding = max(candidates, key=lambda coding: accepted[coding], default="identity")
+
+    headers = {
+        "Cache-Control": "public, max-age=3600",
+        "Vary": "Accept-Encoding"
+    }
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    return Response(
+        content=encode_control_surface(resolution, dtype, include_rules, encoding),
+        media_type="application/octet-stream",
+        headers=headers
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     host = os.getenv("API_HOST", "0.0.0.0")
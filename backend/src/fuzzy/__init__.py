@@ -3,6 +3,9 @@ from .membership import (
     MembershipFunction,
     TriangularMF,
     TrapezoidalMF,
+    GaussianMF,
+    GeneralizedBellMF,
+    SigmoidMF,
     FuzzyVariable,
     create_washing_machine_variables
 )
@@ -11,14 +14,25 @@ from .engine import (
     MamdaniEngine,
     create_washing_machine_engine
 )
+from .analysis import (
+    analyze_engine,
+    apply_parameters,
+    sweep_parameters
+)
 
 __all__ = [
     "MembershipFunction",
     "TriangularMF",
     "TrapezoidalMF",
+    "GaussianMF",
+    "GeneralizedBellMF",
+    "SigmoidMF",
     "FuzzyVariable",
     "create_washing_machine_variables",
     "FuzzyRule",
     "MamdaniEngine",
     "create_washing_machine_engine",
+    "analyze_engine",
+    "apply_parameters",
+    "sweep_parameters",
 ]
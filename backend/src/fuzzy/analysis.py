@@ -0,0 +1,329 @@
+"""
+Rule-base analysis tools for Mamdani engines.
+
+Sweeps the input space with batched inference and reports dead zones
+(inputs where no rule fires), rules that never fire, output monotonicity
+violations and smoothness statistics. Alternative membership function
+parameterizations can be compared in parallel across CPU cores.
+"""
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .engine import MamdaniEngine
+
+
+# In-process cache of evaluated grids, keyed by engine fingerprint
+_grid_cache: Dict[str, Dict[str, np.ndarray]] = {}
+_GRID_CACHE_SIZE = 32
+
+
+def engine_fingerprint(engine: MamdaniEngine, resolution: int) -> str:
+    """
+    Hash the engine definition and sweep resolution.
+
+    Two engines with the same variables, membership function parameters
+    and rules produce the same fingerprint, so their sweeps can share
+    cached results.
+    """
+    definition = {
+        "inputs": [var.to_dict() for var in engine.input_variables.values()],
+        "outputs": [var.to_dict() for var in engine.output_variables.values()],
+        "rules": [str(rule) for rule in engine.rules],
+        "resolution": resolution,
+    }
+    encoded = json.dumps(definition, sort_keys=True, default=float)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _infer_slice(engine: MamdaniEngine, inputs: Dict[str, np.ndarray]) -> Dict:
+    """Worker entry point: batched inference on one slice of the grid."""
+    return engine.infer_batch(inputs, return_rule_activations=True)
+
+
+def _write_cache(cache_dir: str, cache_path: str, grid: Dict[str, np.ndarray]):
+    """
+    Atomically store a grid in the disk cache.
+
+    Parallel workers may write the same key; each writes its own temporary
+    file and renames it into place, so readers never see a partial file.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            np.savez_compressed(tmp_file, **grid)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _evaluate_grid(
+    engine: MamdaniEngine,
+    resolution: int,
+    workers: int,
+    cache_dir: Optional[str]
+) -> Dict[str, np.ndarray]:
+    """
+    Run batched inference over a regular grid of the input space.
+
+    The flattened grid is split into one slice per worker. Results are
+    cached in memory and, if cache_dir is given, on disk so that repeated
+    runs with an unchanged engine skip inference entirely.
+
+    Returns:
+        Dictionary of arrays: one grid per input variable ("input:<name>"),
+        one grid per output variable ("output:<name>") and
+        "rule_activations" of shape (num_rules, *grid_shape)
+    """
+    key = engine_fingerprint(engine, resolution)
+    if key in _grid_cache:
+        return _grid_cache[key]
+
+    cache_path = os.path.join(cache_dir, f"{key}.npz") if cache_dir else None
+    if cache_path and os.path.exists(cache_path):
+        with np.load(cache_path) as cached:
+            grid = {name: cached[name] for name in cached.files}
+    else:
+        variables = list(engine.input_variables.values())
+        axes = [
+            np.linspace(var.range_min, var.range_max, resolution)
+            for var in variables
+        ]
+        mesh = np.meshgrid(*axes, indexing="ij")
+        shape = mesh[0].shape
+        flat = {var.name: values.ravel() for var, values in zip(variables, mesh)}
+
+        n_points = mesh[0].size
+        bounds = np.linspace(0, n_points, max(1, workers) + 1).astype(int)
+        slices = [
+            {name: values[start:stop] for name, values in flat.items()}
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if stop > start
+        ]
+        if len(slices) > 1:
+            with ProcessPoolExecutor(max_workers=len(slices)) as executor:
+                parts = list(executor.map(_infer_slice, [engine] * len(slices), slices))
+        else:
+            parts = [_infer_slice(engine, slices[0])]
+
+        grid = {
+            f"input:{var.name}": values for var, values in zip(variables, mesh)
+        }
+        for var_name in parts[0]["output"]:
+            grid[f"output:{var_name}"] = np.concatenate(
+                [part["output"][var_name] for part in parts]
+            ).reshape(shape)
+        grid["rule_activations"] = np.concatenate(
+            [part["rule_activations"] for part in parts], axis=1
+        ).reshape((len(engine.rules),) + shape)
+
+        if cache_path:
+            _write_cache(cache_dir, cache_path, grid)
+
+    if len(_grid_cache) >= _GRID_CACHE_SIZE:
+        _grid_cache.pop(next(iter(_grid_cache)))
+    _grid_cache[key] = grid
+    return grid
+
+
+def analyze_engine(
+    engine: MamdaniEngine,
+    resolution: int = 101,
+    firing_threshold: float = 0.0,
+    monotonic: Optional[Dict[str, int]] = None,
+    max_examples: int = 20,
+    workers: int = 1,
+    cache_dir: Optional[str] = None
+) -> Dict[str, any]:
+    """
+    Analyze a rule base over a regular grid of the whole input space.
+
+    Args:
+        engine: Engine to analyze
+        resolution: Grid points per input variable, at least 2
+        firing_threshold: A rule counts as fired only above this strength
+        monotonic: Expected direction per input variable, {name: +1 or -1};
+            directions not given are taken from the dominant trend
+        max_examples: Maximum number of dead-zone points to list
+        workers: Number of processes used for the sweep
+        cache_dir: Directory for caching sweep results between runs
+
+    Returns:
+        Dictionary containing:
+            - points: Number of grid points evaluated
+            - dead_zones: Count, fraction and example inputs where no rule fires
+            - rule_usage: Max firing strength and firing fraction per rule
+            - unused_rules: Rules that never fire anywhere on the grid
+            - monotonicity: {output: {input: direction and violation stats}}
+            - smoothness: {output: {input: slope and curvature stats}}
+    """
+    if resolution < 2:
+        raise ValueError(f"resolution must be at least 2, got {resolution}")
+
+    grid = _evaluate_grid(engine, resolution, workers, cache_dir)
+    activations = grid["rule_activations"]
+    input_names = list(engine.input_variables)
+    n_points = grid[f"input:{input_names[0]}"].size
+
+    # Dead zones: no rule fires above the threshold
+    fired = activations > firing_threshold
+    dead = ~fired.any(axis=0) if len(engine.rules) else np.ones(
+        grid[f"input:{input_names[0]}"].shape, dtype=bool
+    )
+    dead_indices = np.argwhere(dead)[:max_examples]
+    dead_zones = {
+        "count": int(dead.sum()),
+        "fraction": float(dead.mean()),
+        "points": [
+            {name: float(grid[f"input:{name}"][tuple(index)]) for name in input_names}
+            for index in dead_indices
+        ]
+    }
+
+    # Rule usage
+    rule_usage = [
+        {
+            "rule": str(rule),
+            "max_firing_strength": float(activations[i].max()),
+            "fire_fraction": float(fired[i].mean())
+        }
+        for i, rule in enumerate(engine.rules)
+    ]
+    unused_rules = [usage["rule"] for usage in rule_usage if usage["fire_fraction"] == 0]
+
+    # Monotonicity and smoothness of each output along each input axis
+    monotonicity = {}
+    smoothness = {}
+    for output_name in engine.output_variables:
+        key = f"output:{output_name}"
+        if key not in grid:
+            continue
+        surface = grid[key]
+        monotonicity[output_name] = {}
+        smoothness[output_name] = {}
+
+        for axis, input_name in enumerate(input_names):
+            variable = engine.input_variables[input_name]
+            step = (variable.range_max - variable.range_min) / (resolution - 1)
+            diffs = np.diff(surface, axis=axis)
+
+            direction = (monotonic or {}).get(input_name)
+            if direction is None:
+                direction = 1 if diffs.sum() >= 0 else -1
+            against = -direction * diffs
+            violations = against > 1e-9
+            monotonicity[output_name][input_name] = {
+                "direction": direction,
+                "violations": int(violations.sum()),
+                "fraction": float(violations.mean()) if diffs.size else 0.0,
+                "max_violation": float(max(against.max(), 0.0)) if diffs.size else 0.0
+            }
+
+            slopes = np.abs(diffs) / step
+            curvature = np.abs(np.diff(surface, n=2, axis=axis)) / step ** 2 \
+                if surface.shape[axis] > 2 else np.zeros(0)
+            smoothness[output_name][input_name] = {
+                "max_slope": float(slopes.max()) if slopes.size else 0.0,
+                "mean_slope": float(slopes.mean()) if slopes.size else 0.0,
+                "max_curvature": float(curvature.max()) if curvature.size else 0.0,
+                "mean_curvature": float(curvature.mean()) if curvature.size else 0.0
+            }
+
+    return {
+        "resolution": resolution,
+        "points": int(n_points),
+        "dead_zones": dead_zones,
+        "rule_usage": rule_usage,
+        "unused_rules": unused_rules,
+        "monotonicity": monotonicity,
+        "smoothness": smoothness
+    }
+
+
+def apply_parameters(
+    engine: MamdaniEngine,
+    parameters: Dict[str, Dict[str, Dict[str, float]]]
+) -> MamdaniEngine:
+    """
+    Return a copy of the engine with membership function parameters replaced.
+
+    Args:
+        engine: Base engine (left unchanged)
+        parameters: {variable_name: {fuzzy_set_name: {param: value}}},
+            e.g. {"dirt": {"MD": {"b": 80}}}
+
+    Returns:
+        Modified copy of the engine
+    """
+    variant = copy.deepcopy(engine)
+    variables = {**variant.input_variables, **variant.output_variables}
+    for var_name, sets in parameters.items():
+        if var_name not in variables:
+            raise ValueError(f"Unknown variable '{var_name}'")
+        for set_name, params in sets.items():
+            mf = variables[var_name].membership_functions.get(set_name)
+            if mf is None:
+                raise ValueError(f"Unknown fuzzy set '{set_name}' of '{var_name}'")
+            for param, value in params.items():
+                if not hasattr(mf, param):
+                    raise ValueError(f"'{set_name}' has no parameter '{param}'")
+                setattr(mf, param, value)
+    return variant
+
+
+def _analyze_variant(
+    engine: MamdaniEngine,
+    parameters: Dict[str, Dict[str, Dict[str, float]]],
+    options: Dict
+) -> Dict:
+    """Worker entry point: analyze one parameterization."""
+    return analyze_engine(apply_parameters(engine, parameters), **options)
+
+
+def sweep_parameters(
+    engine: MamdaniEngine,
+    variants: List[Dict[str, Dict[str, Dict[str, float]]]],
+    workers: Optional[int] = None,
+    stop_when: Optional[Callable[[Dict], bool]] = None,
+    **options
+) -> List[Tuple[Dict, Dict]]:
+    """
+    Analyze alternative membership function parameterizations in parallel.
+
+    Args:
+        engine: Base engine
+        variants: List of parameter overrides, see apply_parameters()
+        workers: Number of processes (defaults to the CPU count)
+        stop_when: Called with each finished report; returning True cancels
+            the variants that have not started yet
+        **options: Passed to analyze_engine() (resolution, cache_dir, ...)
+
+    Returns:
+        List of (parameters, report) tuples in completion order
+    """
+    options["workers"] = 1
+    results = []
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        pending = {
+            executor.submit(_analyze_variant, engine, parameters, options): parameters
+            for parameters in variants
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                parameters = pending.pop(future)
+                report = future.result()
+                results.append((parameters, report))
+                if stop_when is not None and stop_when(report):
+                    for remaining in pending:
+                        remaining.cancel()
+                    return results
+    return results
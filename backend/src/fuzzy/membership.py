@@ -1,11 +1,21 @@
 """
 Membership function definitions for fuzzy logic controller.
-Implements triangular and trapezoidal membership functions.
+Implements triangular, trapezoidal, Gaussian, generalized-bell and
+sigmoid membership functions.
 """
+import math
 import numpy as np
 from typing import Dict, List, Tuple
 
 
+def _as_float_array(x) -> np.ndarray:
+    """Convert input to a floating point array, keeping float32 if given."""
+    x = np.asarray(x)
+    if x.dtype != np.float32:
+        x = x.astype(np.float64, copy=False)
+    return x
+
+
 class MembershipFunction:
     """Base class for membership functions."""
 
@@ -16,6 +26,33 @@ class MembershipFunction:
         """Calculate membership degree for input x."""
         raise NotImplementedError
 
+    def membership_array(self, x: np.ndarray) -> np.ndarray:
+        """
+        Calculate membership degrees for an array of inputs.
+
+        Subclasses override this with a vectorized implementation; the
+        default falls back to calling membership() element by element.
+
+        Args:
+            x: Array of crisp input values
+
+        Returns:
+            Array of membership degrees with the same shape as x
+            (float32 inputs stay float32, everything else is float64)
+        """
+        x = _as_float_array(x)
+        values = np.vectorize(self.membership, otypes=[np.float64])(x)
+        return values.astype(x.dtype, copy=False)
+
+    def support(self) -> Tuple[float, float]:
+        """
+        Interval outside of which the membership degree is exactly 0.
+
+        The engine uses it to skip evaluating fuzzy sets (and rules) that
+        cannot be active for an input.
+        """
+        return -math.inf, math.inf
+
 
 class TriangularMF(MembershipFunction):
     """Triangular membership function."""
@@ -50,6 +87,25 @@ class TriangularMF(MembershipFunction):
                 return 1.0
             return (self.c - x) / (self.c - self.b)
 
+    def membership_array(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized triangular membership, same semantics as membership()."""
+        x = _as_float_array(x)
+        # min(rising, falling) clipped at 0; a vertical edge is a 0/1 step
+        if self.b > self.a:
+            rising = (x - self.a) / (self.b - self.a)
+        else:
+            rising = (x >= self.a).astype(x.dtype)
+        if self.c > self.b:
+            falling = (self.c - x) / (self.c - self.b)
+        else:
+            falling = (x <= self.c).astype(x.dtype)
+        y = np.minimum(rising, falling, out=rising)
+        return np.maximum(y, 0.0, out=y)
+
+    def support(self) -> Tuple[float, float]:
+        """Interval outside of which the membership degree is 0."""
+        return self.a, self.c
+
     def to_dict(self) -> Dict:
         """Export membership function parameters."""
         return {
@@ -94,6 +150,25 @@ class TrapezoidalMF(MembershipFunction):
                 return 1.0
             return (self.d - x) / (self.d - self.c)
 
+    def membership_array(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized trapezoidal membership, same semantics as membership()."""
+        x = _as_float_array(x)
+        # min(rising, 1, falling) clipped at 0; a vertical edge is a 0/1 step
+        if self.b > self.a:
+            rising = (x - self.a) / (self.b - self.a)
+        else:
+            rising = (x >= self.a).astype(x.dtype)
+        if self.d > self.c:
+            falling = (self.d - x) / (self.d - self.c)
+        else:
+            falling = (x <= self.d).astype(x.dtype)
+        y = np.minimum(rising, falling, out=rising)
+        return np.clip(y, 0.0, 1.0, out=y)
+
+    def support(self) -> Tuple[float, float]:
+        """Interval outside of which the membership degree is 0."""
+        return self.a, self.d
+
     def to_dict(self) -> Dict:
         """Export membership function parameters."""
         return {
@@ -103,6 +178,196 @@ class TrapezoidalMF(MembershipFunction):
         }
 
 
+def _check_epsilon(epsilon: float) -> float:
+    """Validate the cutoff of a smooth membership function."""
+    if not 0 <= epsilon < 1:
+        raise ValueError(f"epsilon must be in [0, 1), got {epsilon}")
+    return epsilon
+
+
+def _truncate(mf: MembershipFunction, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Zero membership degrees outside the effective support of mf."""
+    low, high = mf.support()
+    y[(x < low) | (x > high)] = 0.0
+    return y
+
+
+class GaussianMF(MembershipFunction):
+    """
+    Gaussian membership function exp(-(x - c)² / (2σ²)).
+
+    The Gaussian is positive everywhere, so degrees below epsilon are cut
+    to 0. This gives the finite effective support
+    c ± σ·sqrt(2·ln(1/epsilon)) (about c ± 3.7σ for epsilon = 1e-3).
+    epsilon = 0 disables the cutoff.
+    """
+
+    def __init__(self, name: str, c: float, sigma: float, epsilon: float = 1e-3):
+        """
+        Initialize Gaussian membership function.
+
+        Args:
+            name: Name of the fuzzy set
+            c: Center (peak point)
+            sigma: Standard deviation (width), must be positive
+            epsilon: Membership degree below which the function is cut to 0
+        """
+        super().__init__(name)
+        if sigma <= 0:
+            raise ValueError(f"sigma must be positive, got {sigma}")
+        self.c = c
+        self.sigma = sigma
+        self.epsilon = _check_epsilon(epsilon)
+
+    def support(self) -> Tuple[float, float]:
+        """Effective support where the degree is at least epsilon."""
+        if self.epsilon == 0:
+            return -math.inf, math.inf
+        half_width = self.sigma * math.sqrt(-2 * math.log(self.epsilon))
+        return self.c - half_width, self.c + half_width
+
+    def membership(self, x: float) -> float:
+        """Calculate membership degree using Gaussian function."""
+        low, high = self.support()
+        if x < low or x > high:
+            return 0.0
+        return math.exp(-((x - self.c) ** 2) / (2 * self.sigma ** 2))
+
+    def membership_array(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized Gaussian membership, same semantics as membership()."""
+        x = _as_float_array(x)
+        y = np.exp(-np.square(x - self.c) / (2 * self.sigma ** 2))
+        return _truncate(self, x, y.astype(x.dtype, copy=False))
+
+    def to_dict(self) -> Dict:
+        """Export membership function parameters."""
+        return {
+            "type": "gaussian",
+            "name": self.name,
+            "params": {"c": self.c, "sigma": self.sigma, "epsilon": self.epsilon}
+        }
+
+
+class GeneralizedBellMF(MembershipFunction):
+    """
+    Generalized bell membership function 1 / (1 + |(x - c) / a|^(2b)).
+
+    Degrees below epsilon are cut to 0, giving the finite effective support
+    c ± |a|·(1/epsilon - 1)^(1/(2b)). epsilon = 0 disables the cutoff.
+    """
+
+    def __init__(self, name: str, a: float, b: float, c: float, epsilon: float = 1e-3):
+        """
+        Initialize generalized bell membership function.
+
+        Args:
+            name: Name of the fuzzy set
+            a: Half width at membership 0.5, must be non-zero
+            b: Slope control, must be positive
+            c: Center (peak point)
+            epsilon: Membership degree below which the function is cut to 0
+        """
+        super().__init__(name)
+        if a == 0:
+            raise ValueError("a must be non-zero")
+        if b <= 0:
+            raise ValueError(f"b must be positive, got {b}")
+        self.a = a
+        self.b = b
+        self.c = c
+        self.epsilon = _check_epsilon(epsilon)
+
+    def support(self) -> Tuple[float, float]:
+        """Effective support where the degree is at least epsilon."""
+        if self.epsilon == 0:
+            return -math.inf, math.inf
+        half_width = abs(self.a) * (1 / self.epsilon - 1) ** (1 / (2 * self.b))
+        return self.c - half_width, self.c + half_width
+
+    def membership(self, x: float) -> float:
+        """Calculate membership degree using generalized bell function."""
+        low, high = self.support()
+        if x < low or x > high:
+            return 0.0
+        return 1 / (1 + abs((x - self.c) / self.a) ** (2 * self.b))
+
+    def membership_array(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized bell membership, same semantics as membership()."""
+        x = _as_float_array(x)
+        y = 1 / (1 + np.abs((x - self.c) / self.a) ** (2 * self.b))
+        return _truncate(self, x, y.astype(x.dtype, copy=False))
+
+    def to_dict(self) -> Dict:
+        """Export membership function parameters."""
+        return {
+            "type": "bell",
+            "name": self.name,
+            "params": {"a": self.a, "b": self.b, "c": self.c, "epsilon": self.epsilon}
+        }
+
+
+class SigmoidMF(MembershipFunction):
+    """
+    Sigmoid membership function 1 / (1 + exp(-a·(x - c))).
+
+    Rising for a > 0 and falling for a < 0. Degrees below epsilon are cut
+    to 0, which bounds the support on the low side (a > 0) or high side
+    (a < 0) at c - ln(1/epsilon - 1) / a. epsilon = 0 disables the cutoff.
+    """
+
+    def __init__(self, name: str, a: float, c: float, epsilon: float = 1e-3):
+        """
+        Initialize sigmoid membership function.
+
+        Args:
+            name: Name of the fuzzy set
+            a: Slope at the crossover point, must be non-zero
+            c: Crossover point (membership 0.5)
+            epsilon: Membership degree below which the function is cut to 0
+        """
+        super().__init__(name)
+        if a == 0:
+            raise ValueError("a must be non-zero")
+        self.a = a
+        self.c = c
+        self.epsilon = _check_epsilon(epsilon)
+
+    def support(self) -> Tuple[float, float]:
+        """Effective support where the degree is at least epsilon."""
+        if self.epsilon == 0:
+            return -math.inf, math.inf
+        cutoff = self.c - math.log(1 / self.epsilon - 1) / self.a
+        if self.a > 0:
+            return cutoff, math.inf
+        return -math.inf, cutoff
+
+    def membership(self, x: float) -> float:
+        """Calculate membership degree using sigmoid function."""
+        low, high = self.support()
+        if x < low or x > high:
+            return 0.0
+        z = -self.a * (x - self.c)
+        if z > 0:
+            # Equivalent form that cannot overflow for large z
+            return math.exp(-z) / (1 + math.exp(-z))
+        return 1 / (1 + math.exp(z))
+
+    def membership_array(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized sigmoid membership, same semantics as membership()."""
+        x = _as_float_array(x)
+        with np.errstate(over="ignore"):
+            y = 1 / (1 + np.exp(-self.a * (x - self.c)))
+        return _truncate(self, x, y.astype(x.dtype, copy=False))
+
+    def to_dict(self) -> Dict:
+        """Export membership function parameters."""
+        return {
+            "type": "sigmoid",
+            "name": self.name,
+            "params": {"a": self.a, "c": self.c, "epsilon": self.epsilon}
+        }
+
+
 class FuzzyVariable:
     """Fuzzy variable with multiple membership functions."""
 
@@ -134,10 +399,12 @@ class FuzzyVariable:
         Returns:
             Dictionary of membership degrees for each fuzzy set
         """
-        return {
-            name: mf.membership(x)
-            for name, mf in self.membership_functions.items()
-        }
+        degrees = {}
+        for name, mf in self.membership_functions.items():
+            # Sets whose support excludes x are 0 without evaluating them
+            low, high = mf.support()
+            degrees[name] = mf.membership(x) if low <= x <= high else 0.0
+        return degrees
 
     def get_mf_values(self, x_values: np.ndarray) -> Dict[str, np.ndarray]:
         """
@@ -150,7 +417,7 @@ class FuzzyVariable:
             Dictionary of membership values for each fuzzy set
         """
         return {
-            name: np.array([mf.membership(x) for x in x_values])
+            name: mf.membership_array(x_values)
             for name, mf in self.membership_functions.items()
         }
 
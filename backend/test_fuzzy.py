@@ -1,7 +1,17 @@
 """
 Quick test script for fuzzy logic engine
 """
-from src.fuzzy import create_washing_machine_engine
+import json
+import numpy as np
+from src.fuzzy import (
+    FuzzyVariable,
+    GaussianMF,
+    GeneralizedBellMF,
+    SigmoidMF,
+    analyze_engine,
+    create_washing_machine_engine,
+    sweep_parameters,
+)
 
 def test_fuzzy_engine():
     """Test the fuzzy logic engine with example inputs."""
@@ -38,5 +48,148 @@ def test_fuzzy_engine():
     print("\n" + "=" * 50)
     print("✅ 測試完成！")
 
+
+def test_infer_batch_matches_infer():
+    """Batched inference must agree with per-row inference, in small chunks too."""
+    engine = create_washing_machine_engine()
+
+    grid = np.linspace(0, 200, 41)
+    dirt, grease = np.meshgrid(grid, grid)
+    dirt, grease = dirt.ravel(), grease.ravel()
+
+    expected = np.array([
+        engine.infer({"dirt": d, "grease": g})["output"]["wash_time"]
+        for d, g in zip(dirt, grease)
+    ])
+
+    # Budget of a few rows forces many chunks through the reused buffers
+    result = engine.infer_batch(
+        {"dirt": dirt, "grease": grease},
+        memory_budget=7 * 2 * 200 * 8,
+        return_rule_activations=True
+    )
+    assert np.allclose(result["output"]["wash_time"], expected)
+    assert result["rule_activations"].shape == (len(engine.rules), len(dirt))
+
+    # float32 mode stays within the documented bound (2.4e-5 of the range)
+    result32 = engine.infer_batch({"dirt": dirt, "grease": grease}, dtype=np.float32)
+    assert result32["output"]["wash_time"].dtype == np.float32
+    assert np.max(np.abs(result32["output"]["wash_time"] - expected)) < 2.4e-5 * 60
+
+
+def test_control_surface_payload():
+    """The binary surface decodes to the engine outputs on the grid points."""
+    import struct
+    from src.api.main import build_control_surface, parse_accept_encoding
+
+    engine = create_washing_machine_engine()
+    payload = build_control_surface(21, "float32", True)
+
+    header_length = struct.unpack("<I", payload[:4])[0]
+    header = json.loads(payload[4:4 + header_length])
+    offset = 4 + header_length + (-(4 + header_length)) % 8
+    arrays = np.frombuffer(payload[offset:], dtype="<f4").reshape(
+        len(header["arrays"]), *header["shape"]
+    )
+
+    assert header["shape"] == [21, 21]
+    assert header["arrays"][0] == "wash_time"
+    assert len(header["arrays"]) == 1 + len(engine.rules)
+
+    # Grid index 12 on 0..200 with 21 points is 120, index 14 is 140
+    result = engine.infer({"dirt": 120, "grease": 140})
+    assert np.isclose(arrays[0, 12, 14], result["output"]["wash_time"], atol=1e-4)
+    firing = [r["firing_strength"] for r in result["rule_activations"]]
+    assert np.allclose(arrays[1:, 12, 14], firing, atol=1e-6)
+
+    # Codings with q=0 are refused
+    assert parse_accept_encoding("br;q=0, gzip;q=0") == {}
+    assert parse_accept_encoding("gzip;q=0.5, br") == {"gzip": 0.5, "br": 1.0}
+
+
+def test_rule_coverage_analysis(tmp_path):
+    """Analysis finds dead zones and unused rules, and sweeps variants."""
+    engine = create_washing_machine_engine()
+    report = analyze_engine(engine, resolution=21, workers=2)
+    assert report["points"] == 21 * 21
+    assert report["dead_zones"]["count"] == 0
+    assert report["unused_rules"] == []
+    assert report["monotonicity"]["wash_time"]["grease"]["violations"] == 0
+
+    try:
+        analyze_engine(engine, resolution=1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("resolution=1 must be rejected")
+
+    # Without rules every grid point is a dead zone
+    empty = create_washing_machine_engine()
+    empty.rules = []
+    report = analyze_engine(empty, resolution=5)
+    assert report["points"] == report["dead_zones"]["count"] == 25
+
+    # Without "SD AND NG" nothing fires at the clean corner
+    engine.rules.pop(0)
+    report = analyze_engine(engine, resolution=21, cache_dir=str(tmp_path))
+    assert report["dead_zones"]["points"] == [{"dirt": 0.0, "grease": 0.0}]
+    assert list(tmp_path.glob("*.npz"))
+
+    # Moving MD's peak outside the universe leaves "MD AND ..." rules idle
+    engine = create_washing_machine_engine()
+    variants = [{"dirt": {"MD": {"a": 300, "b": 400, "c": 500}}}, {"dirt": {"MD": {"b": 80}}}]
+    results = dict(
+        (json.dumps(params), report)
+        for params, report in sweep_parameters(engine, variants, workers=2, resolution=21)
+    )
+    idle = results[json.dumps(variants[0])]["unused_rules"]
+    assert len(idle) == 3 and all("dirt is MD" in rule for rule in idle)
+    assert results[json.dumps(variants[1])]["unused_rules"] == []
+
+
+def test_smooth_membership_functions():
+    """Smooth MFs are cut to 0 outside their epsilon support, in both paths."""
+    x = np.linspace(-100, 300, 801)
+    for mf in [
+        GaussianMF("g", 100, 20),
+        GeneralizedBellMF("b", 30, 2, 100),
+        SigmoidMF("s", 0.1, 100),
+        SigmoidMF("s", -0.1, 100, epsilon=0.01),
+    ]:
+        low, high = mf.support()
+        values = mf.membership_array(x)
+        assert np.allclose(values, [mf.membership(v) for v in x])
+        assert np.all(values[(x < low) | (x > high)] == 0.0)
+        inside = values[(x >= low) & (x <= high)]
+        assert inside.min() >= mf.epsilon - 1e-12
+        assert mf.to_dict()["params"]["epsilon"] == mf.epsilon
+
+    assert GaussianMF("g", 0, 1, epsilon=0).support() == (-np.inf, np.inf)
+    assert np.isclose(GaussianMF("g", 0, 1, epsilon=np.exp(-2)).support()[1], 2.0)
+
+    # Narrow Gaussian output sets: batched and per-row inference still agree
+    engine = create_washing_machine_engine()
+    wash_time = FuzzyVariable("wash_time", 0, 60)
+    for name, center in [("VS", 0), ("S", 10), ("M", 25), ("L", 40), ("VL", 60)]:
+        wash_time.add_mf(GaussianMF(name, center, 3))
+    engine.add_output_variable(wash_time)
+
+    dirt = np.array([0, 30, 100, 170, 200])
+    grease = np.array([200, 60, 100, 10, 0])
+    expected = [
+        engine.infer({"dirt": d, "grease": g})["output"]["wash_time"]
+        for d, g in zip(dirt, grease)
+    ]
+    result = engine.infer_batch({"dirt": dirt, "grease": grease})
+    assert np.allclose(result["output"]["wash_time"], expected)
+
+
 if __name__ == "__main__":
     test_fuzzy_engine()
+    test_infer_batch_matches_infer()
+    test_control_surface_payload()
+    test_smooth_membership_functions()
+    import tempfile
+    from pathlib import Path
+    with tempfile.TemporaryDirectory() as cache_dir:
+        test_rule_coverage_analysis(Path(cache_dir))
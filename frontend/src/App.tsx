@@ -8,7 +8,8 @@ import { MembershipChart } from './components/MembershipChart';
 import { RuleViewer } from './components/RuleViewer';
 import { OutputChart } from './components/OutputChart';
 import { fuzzyAPI } from './api';
-import type { VisualizationData } from './types';
+import { localVisualization } from './surface';
+import type { ControlSurface, VisualizationData } from './types';
 import PsychologyIcon from '@mui/icons-material/Psychology';
 import WarningIcon from '@mui/icons-material/Warning';
 import TouchAppIcon from '@mui/icons-material/TouchApp';
@@ -33,14 +34,35 @@ function App() {
   const [vizData, setVizData] = useState<VisualizationData | null>(null);
   const [currentInputs, setCurrentInputs] = useState({ dirt: 120, grease: 140 });
   const canvasRef = useRef<HTMLCanvasElement>(null);
+  const surfaceRef = useRef<ControlSurface | null>(null);
+  const baseVizRef = useRef<VisualizationData | null>(null);
+
+  // Fetch the control surface once; input changes are then answered locally
+  useEffect(() => {
+    fuzzyAPI.getSurface(201, 'float32', true)
+      .then(surface => {
+        surfaceRef.current = surface;
+      })
+      .catch(err => {
+        console.warn('Control surface unavailable, using /fuzzy/visualize:', err);
+      });
+  }, []);
 
   const handleInputChange = useCallback(async (dirt: number, grease: number) => {
     setCurrentInputs({ dirt, grease });
+
+    if (surfaceRef.current && baseVizRef.current) {
+      setVizData(localVisualization(surfaceRef.current, baseVizRef.current, dirt, grease));
+      return;
+    }
+
     setLoading(true);
     setError(null);
 
     try {
       const data = await fuzzyAPI.getVisualization(dirt, grease);
+      // Membership curves do not depend on the inputs, keep them for local updates
+      baseVizRef.current = data;
       setVizData(data);
     } catch (err: any) {
       setError(err.message || '無法連接到後端 API');
@@ -2,7 +2,8 @@
  * API client for fuzzy logic backend
  */
 import axios from 'axios';
-import type { InferenceResult, VisualizationData } from './types';
+import type { ControlSurface, InferenceResult, VisualizationData } from './types';
+import { parseSurface } from './surface';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -84,6 +85,26 @@ export const fuzzyAPI = {
     return response.data;
   },
 
+  /**
+   * Get the precomputed control surface (fetch once, interpolate locally
+   * with interpolateSurface instead of calling getVisualization per change)
+   */
+  getSurface: async (
+    resolution: number = 201,
+    dtype: 'float16' | 'float32' = 'float32',
+    includeRules: boolean = false
+  ): Promise<ControlSurface> => {
+    const response = await api.get('/fuzzy/surface', {
+      params: {
+        resolution,
+        dtype,
+        include_rules: includeRules,
+      },
+      responseType: 'arraybuffer',
+    });
+    return parseSurface(response.data);
+  },
+
   /**
    * Get membership function definitions
    */
@@ -0,0 +1,173 @@
+/**
+ * Decoding and local interpolation of the binary control surface
+ * returned by GET /fuzzy/surface
+ */
+import type { ControlSurface, RuleActivation, VisualizationData } from './types';
+
+/**
+ * Convert an IEEE 754 half-precision value to a number
+ */
+function halfToFloat(bits: number): number {
+  const sign = bits & 0x8000 ? -1 : 1;
+  const exponent = (bits >> 10) & 0x1f;
+  const fraction = bits & 0x3ff;
+
+  if (exponent === 0) {
+    return sign * 2 ** -14 * (fraction / 1024);
+  }
+  if (exponent === 0x1f) {
+    return fraction ? NaN : sign * Infinity;
+  }
+  return sign * 2 ** (exponent - 15) * (1 + fraction / 1024);
+}
+
+/**
+ * Parse the payload: uint32 header length, JSON header, padding to an
+ * 8-byte boundary, then the arrays listed in the header (little-endian)
+ */
+export function parseSurface(buffer: ArrayBuffer): ControlSurface {
+  const view = new DataView(buffer);
+  const headerLength = view.getUint32(0, true);
+  const header = JSON.parse(
+    new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength))
+  );
+
+  const size = header.shape.reduce((a: number, b: number) => a * b, 1);
+  const itemSize = header.dtype === 'float16' ? 2 : 4;
+  let offset = 4 + headerLength;
+  offset += (8 - (offset % 8)) % 8;
+
+  const arrays: ControlSurface['arrays'] = {};
+  for (const name of header.arrays as string[]) {
+    const values = new Float32Array(size);
+    for (let i = 0; i < size; i++) {
+      const position = offset + i * itemSize;
+      values[i] = itemSize === 2
+        ? halfToFloat(view.getUint16(position, true))
+        : view.getFloat32(position, true);
+    }
+    arrays[name] = values;
+    offset += size * itemSize;
+  }
+
+  return {
+    dtype: header.dtype,
+    shape: header.shape,
+    inputs: header.inputs,
+    arrays,
+  };
+}
+
+/**
+ * Bilinearly interpolate a 2-input surface array at the given inputs
+ */
+export function interpolateSurface(
+  surface: ControlSurface,
+  name: string,
+  values: number[]
+): number {
+  const grid = surface.arrays[name];
+  const [rows, cols] = surface.shape;
+
+  const position = (value: number, axis: number, points: number) => {
+    const [min, max] = surface.inputs[axis].range;
+    const t = ((value - min) / (max - min)) * (points - 1);
+    return Math.min(Math.max(t, 0), points - 1);
+  };
+
+  const u = position(values[0], 0, rows);
+  const v = position(values[1], 1, cols);
+  const i0 = Math.min(Math.floor(u), rows - 2);
+  const j0 = Math.min(Math.floor(v), cols - 2);
+  const du = u - i0;
+  const dv = v - j0;
+
+  const at = (i: number, j: number) => grid[i * cols + j];
+  return (
+    at(i0, j0) * (1 - du) * (1 - dv) +
+    at(i0 + 1, j0) * du * (1 - dv) +
+    at(i0, j0 + 1) * (1 - du) * dv +
+    at(i0 + 1, j0 + 1) * du * dv
+  );
+}
+
+/**
+ * Linearly interpolate a sampled curve at x
+ */
+function interpolateCurve(xValues: number[], yValues: number[], x: number): number {
+  const last = xValues.length - 1;
+  const t = ((x - xValues[0]) / (xValues[last] - xValues[0])) * last;
+  const i = Math.min(Math.max(Math.floor(t), 0), last - 1);
+  const d = Math.min(Math.max(t - i, 0), 1);
+  return yValues[i] * (1 - d) + yValues[i + 1] * d;
+}
+
+/**
+ * Build visualization data for new inputs without a server round trip.
+ *
+ * Crisp output and rule strengths come from the control surface (fetched
+ * with per-rule grids); membership curves do not depend on the inputs and
+ * are reused from an earlier /fuzzy/visualize response. The aggregated
+ * output curve is rebuilt with MAX-MIN from those curves.
+ */
+export function localVisualization(
+  surface: ControlSurface,
+  base: VisualizationData,
+  dirt: number,
+  grease: number
+): VisualizationData {
+  const inputs = [dirt, grease];
+
+  const ruleActivations: RuleActivation[] = base.inference_result.rule_activations.map(rule => ({
+    ...rule,
+    firing_strength: Math.max(0, interpolateSurface(surface, rule.rule, inputs)),
+  }));
+
+  // Aggregation: MAX of firing strengths per consequent set
+  const aggregated: { [variable: string]: { [fuzzySet: string]: number } } = {};
+  for (const rule of ruleActivations) {
+    const [variable, fuzzySet] = rule.consequent;
+    aggregated[variable] = aggregated[variable] || {};
+    aggregated[variable][fuzzySet] = Math.max(
+      aggregated[variable][fuzzySet] ?? 0,
+      rule.firing_strength
+    );
+  }
+
+  const fuzzifiedInputs: VisualizationData['inference_result']['fuzzified_inputs'] = {};
+  surface.inputs.forEach((input, axis) => {
+    const curves = base.membership_curves[input.name];
+    fuzzifiedInputs[input.name] = Object.fromEntries(
+      Object.entries(curves.curves).map(([name, values]) => [
+        name,
+        interpolateCurve(curves.x_values, values, inputs[axis]),
+      ])
+    );
+  });
+
+  // Aggregated output curve: MAX over sets of MIN(curve, activation)
+  const output = base.membership_curves.wash_time;
+  const yValues = output.x_values.map((_, i) =>
+    Object.entries(aggregated.wash_time || {}).reduce(
+      (value, [name, activation]) =>
+        Math.max(value, Math.min(output.curves[name]?.[i] ?? 0, activation)),
+      0
+    )
+  );
+
+  const washTime = interpolateSurface(surface, 'wash_time', inputs);
+  return {
+    inference_result: {
+      output: { wash_time: washTime },
+      fuzzified_inputs: fuzzifiedInputs,
+      rule_activations: ruleActivations,
+      aggregated_output: aggregated,
+    },
+    membership_curves: base.membership_curves,
+    aggregated_output: {
+      x_values: output.x_values,
+      y_values: yValues,
+      centroid: washTime,
+    },
+  };
+}
@@ -3,13 +3,15 @@
  */
 
 export interface MembershipFunction {
-  type: 'triangular' | 'trapezoidal';
+  type: 'triangular' | 'trapezoidal' | 'gaussian' | 'bell' | 'sigmoid';
   name: string;
   params: {
-    a: number;
-    b: number;
+    a?: number;
+    b?: number;
     c: number;
     d?: number;
+    sigma?: number;
+    epsilon?: number;
   };
 }
 
@@ -61,3 +63,18 @@ export interface VisualizationData {
     centroid: number;
   };
 }
+
+export interface SurfaceInput {
+  name: string;
+  range: [number, number];
+}
+
+export interface ControlSurface {
+  dtype: 'float16' | 'float32';
+  shape: number[];
+  inputs: SurfaceInput[];
+  /** Output surfaces and optional per-rule grids, keyed by name */
+  arrays: {
+    [name: string]: Float32Array;
+  };
+}